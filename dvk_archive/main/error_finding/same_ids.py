@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 from argparse import ArgumentParser
+from collections import defaultdict
 from dvk_archive.main.color_print import color_print
 from dvk_archive.main.file.dvk import Dvk
 from dvk_archive.main.file.dvk_handler import DvkHandler
@@ -26,29 +27,24 @@ def get_same_ids(directory:str=None) -> List[List[str]]:
     # READ DVKS IN DIRECTORY
     dvk_handler = DvkHandler()
     dvk_handler.read_dvks(directory)
-    dvk_handler.sort_dvks("a")
-    # RUN THROUGH ALL DVKS
-    indexes = []
-    same = []
+    # GROUP DVKS BY THEIR DVK ID, KEEPING THE ORDER THEY WERE READ IN
+    groups = defaultdict(list)
     size = dvk_handler.get_size()
     print("Finding DVK files with the same IDs:")
-    for comp_num in tqdm(range(0, size - 1)):
-        comp_dvk = dvk_handler.get_dvk(comp_num)
-        current_same = [comp_dvk.get_dvk_file()]
-        # ONLY CHECK DUPLICATES IF NOT ALREADY INCLUDED
-        if not comp_num in indexes:
-            for cur_num in range(comp_num + 1, size):
-                cur_dvk = dvk_handler.get_dvk(cur_num)
-                # CHECK IF IDS ARE THE SAME
-                if (not cur_num in indexes
-                        and comp_dvk.get_dvk_id() == cur_dvk.get_dvk_id()):
-                    indexes.append(cur_num)
-                    current_same.append(cur_dvk.get_dvk_file())
-        # ADD GROUP TO SAME ID LIST IF MATCHING IDS FOUND
-        if len(current_same) > 1:
-            same.append(current_same)
-    # RETURN LIST OF DVKS WITH THE SAME ID
-    return same
+    for dvk_num in tqdm(range(0, size)):
+        dvk = dvk_handler.get_dvk(dvk_num)
+        groups[dvk.get_dvk_id()].append((dvk_num, dvk))
+    # ONLY KEEP GROUPS WITH MORE THAN ONE DVK, THEN SORT ALPHABETICALLY
+    # ONLY DUPLICATES ARE SORTED, RATHER THAN EVERY LOADED DVK
+    key = dvk_handler.get_alpha_key
+    same = []
+    for group in groups.values():
+        if len(group) > 1:
+            group.sort(key=lambda item: key(item[1]))
+            same.append(group)
+    same.sort(key=lambda group: (key(group[0][1]), group[0][0]))
+    # RETURN LIST OF DVK FILES WITH THE SAME ID
+    return [[dvk.get_dvk_file() for dvk_num, dvk in group] for group in same]
 
 def main():
     """
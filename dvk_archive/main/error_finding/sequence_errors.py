@@ -145,12 +145,13 @@ def get_sequence_errors(directory:str=None) -> List[List[str]]:
     error_indexes = []
     checked_indexes = []
     size = dvk_handler.get_size()
+    id_indexes = dvk_handler.get_id_indexes()
     print("Finding sequence errors:")
     for index in tqdm(range(0, size)):
         # Only check Dvk if not alreadiy in checked list.
         if not index in checked_indexes:
             # Get sequence, then add to checked indexes
-            seq = get_sequence(dvk_handler, index)
+            seq = get_sequence(dvk_handler, index, id_indexes)
             checked_indexes.extend(seq)
             # Check if sequence is invalid
             if (is_invalid_single(dvk_handler, seq) 
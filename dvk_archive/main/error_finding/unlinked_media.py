@@ -6,8 +6,8 @@ from dvk_archive.main.file.dvk import Dvk
 from dvk_archive.main.file.dvk_handler import DvkHandler
 from dvk_archive.main.file.dvk_handler import get_directories
 from dvk_archive.main.processing.string_processing import truncate_path
-from os import getcwd, listdir
-from os.path import abspath, exists, isdir, join
+from os import getcwd, scandir
+from os.path import abspath, exists, isdir
 from tqdm import tqdm
 from typing import List
 
@@ -27,21 +27,28 @@ def get_unlinked_media(directory:str=None) -> List[str]:
     # READ DVKS IN DIRECTORY
     dvk_handler = DvkHandler()
     dvk_handler.read_dvks(directory)
+    # GET ALL MEDIA FILES LINKED BY THE LOADED DVKS
+    linked = set()
+    for dvk_num in range(0, dvk_handler.get_size()):
+        dvk = dvk_handler.get_dvk(dvk_num)
+        linked.add(dvk.get_media_file())
+        linked.add(dvk.get_secondary_file())
     # GET LIST OF DIRECTORIES WITH DVK FILES
     dirs = sorted(get_directories(directory))
     # RUN THROUGH DIRECTORIES
     unlinked = []
     print("Finding unlinked media files:")
     for path in tqdm(dirs):
-        files = sorted(listdir(abspath(path)))
+        # DIRECTORIES ARE ALREADY ABSOLUTE, SO ENTRY PATHS ARE TOO
+        with scandir(path) as entries:
+            files = sorted(entries, key=lambda entry: entry.name)
         # RUN THROUGH ALL FILES IN THE DIRECTORY
         for file in files:
             # ADD TO UNLINKED IF NO DVKS LINK THIS FILE
-            full_file = abspath(join(path, file))
-            if (not file.endswith(".dvk")
-                    and not isdir(full_file)
-                    and not dvk_handler.contains_media_file(full_file)):
-                unlinked.append(abspath(full_file))
+            if (not file.name.endswith(".dvk")
+                    and not file.is_dir()
+                    and file.path not in linked):
+                unlinked.append(file.path)
     return unlinked
 
 def main():
@@ -4,20 +4,42 @@ from dvk_archive.main.color_print import color_print
 from dvk_archive.main.web.bs_connect import download
 from dvk_archive.main.web.bs_connect import get_last_modified
 from dvk_archive.main.processing.list_processing import clean_list
+from dvk_archive.main.processing.string_processing import get_extension
 from dvk_archive.main.processing.string_processing import get_filename
 from dvk_archive.main.processing.string_processing import pad_num
-from html_string_tools.main.html_string_tools import get_extension
-from html_string_tools.main.html_string_tools import remove_whitespace
 from html_string_tools.main.html_string_tools import replace_reserved_in_html
 from filetype import guess
-from json import dump, load
-from os import listdir, pardir, rename, remove
-from os.path import abspath, basename, exists, isdir, join
-from random import seed, randint
+from json.encoder import encode_basestring_ascii
+from orjson import dumps, loads, OPT_INDENT_2
+from os import listdir, rename, remove
+from os.path import abspath, basename, dirname, exists, isdir, join
+from random import Random
+from re import compile as re_compile
 from shutil import move
 from traceback import print_exc
 from typing import List
 
+# Pattern for runs of non-ASCII characters in JSON text
+NON_ASCII_PATTERN = re_compile("[^\\x00-\\x7f]+")
+
+def escape_non_ascii(json_bytes:bytes=None) -> bytes:
+    """
+    Escapes non-ASCII characters in UTF-8 JSON data as \\uXXXX sequences.
+    Matches the output of the json module, so older readers can read the data.
+
+    :param json_bytes: UTF-8 encoded JSON data, defaults to None
+    :type json_bytes: bytes, optional
+    :return: ASCII encoded JSON data
+    :rtype: bytes
+    """
+    # Return given data if there is nothing to escape
+    if json_bytes is None or json_bytes.isascii():
+        return json_bytes
+    # Escape each run of non-ASCII characters
+    text = json_bytes.decode("utf-8")
+    text = NON_ASCII_PATTERN.sub(lambda match: encode_basestring_ascii(match.group())[1:-1], text)
+    return text.encode("ascii")
+
 def dictadd(dictionary:dict=None,
                 key:str=None,
                 value=None,
@@ -170,8 +192,8 @@ class Dvk:
             dvk_data = dictadd(dvk_data, "sequence", dvk_seq, dict())
             # Write dvk_data dict to a DVK(JSON) file.
             try:
-                with open(self.get_dvk_file(), "w") as out_file:
-                    dump(dvk_data, out_file, indent=4, separators=(",", ": "))
+                with open(self.get_dvk_file(), "wb") as out_file:
+                    out_file.write(escape_non_ascii(dumps(dvk_data, option=OPT_INDENT_2)))
             except IOError as e:
                 color_print("File error: " + str(e), "r")
 
@@ -218,8 +240,8 @@ class Dvk:
         self.clear_dvk()
         # Read DVK file as a JSON object
         try:
-            with open(self.get_dvk_file()) as in_file:
-                json = load(in_file)
+            with open(self.get_dvk_file(), "rb") as in_file:
+                json = loads(in_file.read())
                 # Check if file is a proper DVK file.
                 if json["file_type"] == "dvk":
                     # Get DVK ID.
@@ -285,7 +307,7 @@ class Dvk:
         :type dvk_id: str, optional
         """
         try:
-            self.dvk_id = remove_whitespace(dvk_id.upper())
+            self.dvk_id = dvk_id.upper().strip()
             if self.dvk_id == "":
                 self.dvk_id = None
         except AttributeError:
@@ -309,7 +331,7 @@ class Dvk:
         """
         self.title = title
         if self.title is not None:
-            self.title = remove_whitespace(self.title)
+            self.title = self.title.strip()
 
     def get_title(self) -> str:
         """
@@ -386,14 +408,8 @@ class Dvk:
             # If time is invalid, set empty publication date.
             self.time = "0000/00/00|00:00"
         else:
-            # Pad times with zeros if necessary.
-            year_str = pad_num(str(year), 4)
-            month_str = pad_num(str(month), 2)
-            day_str = pad_num(str(day), 2)
-            hour_str = pad_num(str(hour), 2)
-            minute_str = pad_num(str(minute), 2)
-            # Combine to make time string.
-            self.time = year_str + "/" + month_str + "/" + day_str + "|" + hour_str + ":" + minute_str
+            # Combine to make time string, padding times with zeros.
+            self.time = f"{year:04d}/{month:02d}/{day:02d}|{hour:02d}:{minute:02d}"
 
     def set_time(self, time_str:str=None):
         """
@@ -454,7 +470,9 @@ class Dvk:
         :param description: Dvk description, defaults to None
         :type description: str, optional
         """
-        self.description = replace_reserved_in_html(remove_whitespace(description))
+        if description is not None:
+            description = description.strip()
+        self.description = replace_reserved_in_html(description)
         if self.description == "":
             self.description = None
 
@@ -547,7 +565,7 @@ class Dvk:
         :rtype: str
         """
         try:
-            parent = abspath(join(abspath(self.get_dvk_file()), pardir))
+            parent = dirname(abspath(self.get_dvk_file()))
             if not exists(parent):
                 return None
             return abspath(join(parent, self.media_file))
@@ -574,7 +592,7 @@ class Dvk:
         :rtype: str
         """
         try:
-            parent = abspath(join(abspath(self.get_dvk_file()), pardir))
+            parent = dirname(abspath(self.get_dvk_file()))
             if not exists(parent):
                 return None
             return abspath(join(parent, self.secondary_file))
@@ -729,7 +747,9 @@ class Dvk:
         :param seq_title: Sequence title, defaults to None
         :type seq_title: str, optional
         """
-        self.seq_title = remove_whitespace(seq_title)
+        self.seq_title = seq_title
+        if self.seq_title is not None:
+            self.seq_title = self.seq_title.strip()
         if self.seq_title == "":
             self.seq_title = None
 
@@ -749,7 +769,9 @@ class Dvk:
         :param section_title: Section title, defaults to None
         :type section_title: str, optional
         """
-        self.section_title = remove_whitespace(section_title)
+        self.section_title = section_title
+        if self.section_title is not None:
+            self.section_title = self.section_title.strip()
         if self.section_title == "":
             self.section_title = None
 
@@ -833,10 +855,8 @@ class Dvk:
             ext = get_extension(self.get_direct_url())
         else:
             ext = ""
-        # Get list of files in the directory
-        paths = listdir(directory)
-        for i in range(0, len(paths)):
-            paths[i] = paths[i].lower()
+        # Get set of lowercase files in the directory
+        paths = {path.lower() for path in listdir(directory)}
         # Get default filename
         filename = get_filename(self.get_title())
         if (self.get_sequence_total() > 1
@@ -856,9 +876,10 @@ class Dvk:
         if not lower == old and (lower + ".dvk" in paths or lower + ext in paths):
             filename = filename + " - " + self.get_artists()[0]
             lower = filename.lower()
-            seed(self.get_dvk_id())
+            # Use a local generator, since renames may run on multiple threads
+            generator = Random(self.get_dvk_id())
             while lower + ".dvk" in paths or lower + ext in paths:
-                ver = str(randint(1, 9999))
+                ver = str(generator.randint(1, 9999))
                 filename = get_filename(self.get_title()) + "_V" + ver
                 lower = filename.lower()
         # Add suffix if for a secondary file
@@ -878,7 +899,7 @@ class Dvk:
         """
         # RENAME DVK FILE
         remove(self.get_dvk_file())
-        parent = abspath(join(self.get_dvk_file(), pardir))
+        parent = dirname(abspath(self.get_dvk_file()))
         file = join(parent, filename + ".dvk")
         self.set_dvk_file(file)
         # RENAME MEDIA FILE
@@ -975,7 +996,7 @@ class Dvk:
         """
         if exists(self.get_dvk_file()):
             # GET PARENT DIRECTORY
-            parent = abspath(join(self.get_dvk_file(), pardir))
+            parent = dirname(abspath(self.get_dvk_file()))
             # MAIN MEDIA FILE
             media_file = self.get_media_file()
             if media_file is not None and exists(media_file):
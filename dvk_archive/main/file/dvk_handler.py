@@ -1,13 +1,12 @@
 #!/usr/bin/env python3
 
-from _functools import cmp_to_key
+from concurrent.futures import ThreadPoolExecutor
 from dvk_archive.main.file.dvk import Dvk
-from dvk_archive.main.processing.string_compare import compare_alphanum
-from dvk_archive.main.processing.string_compare import compare_strings
+from dvk_archive.main.processing.string_compare import get_alphanum_key
 from tqdm import tqdm
 from typing import List
-from os import listdir, walk
-from os.path import abspath, exists, isdir, join
+from os import scandir
+from os.path import abspath, exists, isdir
 
 
 def get_directories(directory:str=None, only_dvk:bool=True) -> List[str]:
@@ -29,28 +28,55 @@ def get_directories(directory:str=None, only_dvk:bool=True) -> List[str]:
     path = abspath(directory)
     if not exists(path) or not isdir(path):
         return []
-    # GET ALL DIRECTORIES AND SUBDIRECTORIES
+    # GET ALL DIRECTORIES AND SUBDIRECTORIES IN A SINGLE PASS
     dirs = []
-    for p in walk(path):
-        dirs.append(abspath(p[0]))
-    # IF SET TO ONLY RETURN DIRECTORIES WITH DVK FILES,
-    # FILTER OUT DIRECTORIES WITHOUT DVK FILES
-    if only_dvk:
-        i = 0
-        while i < len(dirs):
-            dvk_dirs = listdir(dirs[i])
-            delete = True
-            for file in dvk_dirs:
-                if file.endswith(".dvk"):
-                    delete = False
-                    break
-            if delete:
-                del dirs[i]
-                i = i - 1
-            # INCREMENT COUNTER
-            i = i + 1
+    stack = [path]
+    while len(stack) > 0:
+        current = stack.pop()
+        sub_dirs = []
+        has_dvk = False
+        try:
+            with scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        sub_dirs.append(entry.path)
+                    elif not has_dvk and entry.name.endswith(".dvk"):
+                        has_dvk = True
+        except OSError:
+            continue
+        # IF SET TO ONLY RETURN DIRECTORIES WITH DVK FILES,
+        # SKIP DIRECTORIES WITHOUT DVK FILES
+        if has_dvk or not only_dvk:
+            dirs.append(current)
+        # SEARCH SUBDIRECTORIES IN ORDER
+        sub_dirs.reverse()
+        stack.extend(sub_dirs)
     return dirs
 
+def read_directory_dvks(directory:str=None) -> List[Dvk]:
+    """
+    Reads all the DVK files in a given directory, ignoring subdirectories.
+    Only returns Dvks that were read successfully.
+
+    :param directory: Directory from which to load DVKs, defaults to None
+    :type directory: str, optional
+    :return: Dvks read from the given directory
+    :rtype: list[Dvk]
+    """
+    # RETURN EMPTY LIST IF GIVEN DIRECTORY IS INVALID
+    if directory is None:
+        return []
+    # READ EACH DVK FILE IN THE DIRECTORY
+    # ENTRY PATHS ARE ALREADY ABSOLUTE, SINCE THE DIRECTORY IS
+    dvks = []
+    with scandir(abspath(directory)) as entries:
+        for entry in entries:
+            if entry.name.endswith(".dvk"):
+                dvk = Dvk(entry.path)
+                if dvk.get_title() is not None:
+                    dvks.append(dvk)
+    return dvks
+
 class DvkHandler:
 
     def __init__(self, directory:str=None):
@@ -61,7 +87,7 @@ class DvkHandler:
         :param directory: Directory from which to load DVKs, defaults to None
         :type directory: str, optional
         """
-        self.dvks = []
+        self.dvks:List[Dvk] = []
         if directory is not None:
             self.read_dvks(directory)
     
@@ -81,14 +107,12 @@ class DvkHandler:
             dirs = [absolute]
             if include_subs:
                 dirs = get_directories(absolute)
-            # LOAD LIST OF DVK FILES
+            # LOAD DVK FILES, READING DIRECTORIES IN PARALLEL
             print("Reading DVK files:")
-            for path in tqdm(dirs):
-                for file in listdir(path):
-                    if file.endswith(".dvk"):
-                        dvk = Dvk(abspath(join(path, file)))
-                        if dvk.get_title() is not None:
-                            self.dvks.append(dvk)
+            with ThreadPoolExecutor() as executor:
+                results = executor.map(read_directory_dvks, dirs)
+                for dvks in tqdm(results, total=len(dirs)):
+                    self.dvks.extend(dvks)
 
     def sort_dvks(self, sort_type:str=None):
         """
@@ -100,52 +124,42 @@ class DvkHandler:
         print("Sorting DVK files...")
         if sort_type is not None and self.get_size() > 0:
             if sort_type == "t":
-                comparator = cmp_to_key(self.compare_time)
+                key = self.get_time_key
             else:
-                comparator = cmp_to_key(self.compare_alpha)
-            self.dvks = sorted(self.dvks, key=comparator)
+                key = self.get_alpha_key
+            self.dvks.sort(key=key)
+    
+    def get_time_key(self, dvk:Dvk=None) -> tuple:
+        """
+        Returns a key for sorting a Dvk object by its publication time.
+        Dvks with the same time are sorted by title.
 
-    def compare_time(self, x:Dvk=None, y:Dvk=None) -> int:
+        :param dvk: Dvk object, defaults to None
+        :type dvk: Dvk, optional
+        :return: Sort key for the given Dvk
+        :rtype: tuple
         """
-        Compare two Dvk objects by their publication time.
+        # RETURN EMPTY KEY IF DVK IS NONE
+        if dvk is None:
+            return ()
+        # SORT BY TIME, THEN BY TITLE
+        return (dvk.get_time(), get_alphanum_key(dvk.get_title()))
 
-        :param x: 1st Dvk object, defaults to None
-        :type x: Dvk, optional
-        :param y: 2nd Dvk object, defaults to None
-        :type y: Dvk, optional
-        :return: Which Dvk should come first
-        :rtype: int
+    def get_alpha_key(self, dvk:Dvk=None) -> tuple:
         """
-        # RETURN 0 IF EITHER DVK IS NONE
-        if x is None or y is None:
-            return 0
-        # COMPARE BY TIME
-        result = compare_strings(x.get_time(), y.get_time())
-        # IF TIMES ARE THE SAME, COMPARE BY TITLE
-        if result == 0:
-            result = compare_alphanum(x.get_title(), y.get_title())
-        return result
-
-    def compare_alpha(self, x:Dvk=None, y:Dvk=None) -> int:
-        """
-        Compare two Dvk objects alphabetically by title.
-
-        :param x: 1st Dvk object, defaults to None
-        :type x: Dvk, optional
-        :param y: 2nd Dvk object, defaults to None
-        :type y: Dvk, optional
-        :return: Which Dvk should come first
-        :rtype: int
+        Returns a key for sorting a Dvk object alphabetically by title.
+        Dvks with the same title are sorted by time.
+
+        :param dvk: Dvk object, defaults to None
+        :type dvk: Dvk, optional
+        :return: Sort key for the given Dvk
+        :rtype: tuple
         """
-        # RETURN 0 IF EITHER DVK IS NONE
-        if x is None or y is None:
-            return 0
-        # COMPARE BY TITLE
-        result = compare_alphanum(x.get_title(), y.get_title())
-        # IF TITLES ARE THE SAME, COMPARE BY TIME
-        if result == 0:
-            result = compare_strings(x.get_time(), y.get_time())
-        return result
+        # RETURN EMPTY KEY IF DVK IS NONE
+        if dvk is None:
+            return ()
+        # SORT BY TITLE, THEN BY TIME
+        return (get_alphanum_key(dvk.get_title()), dvk.get_time())
 
     def get_size(self) -> int:
         """
@@ -177,7 +191,7 @@ class DvkHandler:
         """
         if dvk is not None and dvk.can_write():
             self.dvks.append(dvk)
-
+    
     def set_dvk(self, dvk:Dvk=None, index:int=-1):
         """
         Sets the Dvk at a given index.
@@ -193,7 +207,7 @@ class DvkHandler:
                 and index > -1
                 and index < self.get_size()):
             self.dvks[index] = dvk
-
+    
     def remove_dvk(self, index:int=-1):
         """
         Removes the Dvk at a given index.
@@ -203,7 +217,7 @@ class DvkHandler:
         """
         if index > -1 and index < self.get_size():
             del self.dvks[index]
-
+    
     def get_dvk_by_id(self, dvk_id:str=None) -> int:
         """
         Returns the index of the Dvk with the given ID.
@@ -219,11 +233,25 @@ class DvkHandler:
             return -1
         # SEARCH FOR GIVEN ID IN LOADED DVKS
         upper_id = dvk_id.upper()
-        for i in range(0, self.get_size()):
-            if self.get_dvk(i).get_dvk_id() == upper_id:
+        for i, dvk in enumerate(self.dvks):
+            if dvk.get_dvk_id() == upper_id:
                 return i
         return -1
 
+    def get_id_indexes(self) -> dict:
+        """
+        Returns a dict mapping each loaded Dvk ID to the first index holding it.
+        Meant for many ID lookups in a single pass over unchanged Dvks.
+        The dict isn't updated when the Dvks or their IDs change.
+
+        :return: Indexes of the loaded Dvks, keyed by Dvk ID
+        :rtype: dict
+        """
+        id_indexes = dict()
+        for i, dvk in enumerate(self.dvks):
+            id_indexes.setdefault(dvk.get_dvk_id(), i)
+        return id_indexes
+
     def contains_id(self, dvk_id:str=None) -> bool:
         """
         Returns whether there are any Dvk objects with the given Dvk ID.
@@ -252,8 +280,8 @@ class DvkHandler:
             return False
         # SEARCH FOR GIVEN PAGE URL IN LOADED DVKS
         upper_url = page_url.upper()
-        for i in range(0, self.get_size()):
-            if self.get_dvk(i).get_page_url().upper() == upper_url:
+        for dvk in self.dvks:
+            if dvk.get_page_url().upper() == upper_url:
                 return True
         return False
 
@@ -271,12 +299,11 @@ class DvkHandler:
             return False
         # SEARCH FOR GIVEN DIRECT URL IN LOADED DVKS
         upper_url = direct_url.upper()
-        for i in range(0, self.get_size()):
-            dvk = self.get_dvk(i)
-            if ((dvk.get_direct_url() is not None
-                    and dvk.get_direct_url().upper() == upper_url)
-                    or (dvk.get_secondary_url() is not None
-                    and dvk.get_secondary_url().upper() == upper_url)):
+        for dvk in self.dvks:
+            direct = dvk.get_direct_url()
+            secondary = dvk.get_secondary_url()
+            if ((direct is not None and direct.upper() == upper_url)
+                    or (secondary is not None and secondary.upper() == upper_url)):
                 return True
         return False
 
@@ -295,8 +322,7 @@ class DvkHandler:
             return False
         # SEARCH FOR GIVEN MEDIA FILE IN LOADED DVKS
         path = abspath(media_file)
-        for i in range(0, self.get_size()):
-            dvk = self.get_dvk(i)
+        for dvk in self.dvks:
             media = dvk.get_media_file()
             secondary = dvk.get_secondary_file()
             if ((media is not None and media == path)
@@ -5,10 +5,9 @@ from dvk_archive.main.file.dvk import Dvk
 from dvk_archive.main.file.dvk_handler import DvkHandler
 from dvk_archive.main.color_print import color_print
 from dvk_archive.main.processing.html_processing import create_html_tag
-from dvk_archive.main.processing.string_processing import pad_num
 from dvk_archive.main.processing.list_processing import clean_list
 from dvk_archive.main.processing.list_processing import list_to_string
-from html_string_tools.main.html_string_tools import get_extension
+from dvk_archive.main.processing.string_processing import get_extension
 from html_string_tools.main.html_string_tools import replace_reserved_characters
 from os import mkdir, pardir
 from os.path import abspath, exists, isdir, join
@@ -18,6 +17,11 @@ from traceback import print_exc
 from typing import List
 from webbrowser import open as web_open
 
+IMAGE_EXTENSIONS = frozenset([".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp",
+                              ".apng", ".avif", ".jfif", ".pjpeg", ".pjp"])
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+          "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
 def get_file_as_url(file:str=None) -> str:
     """
     Converts a file path to be read as a URL in a web browser.
@@ -84,14 +88,7 @@ def list_to_lines(lst:List[str]=None) -> str:
     if lst is None:
         return ""
     # Convert list to single string
-    lines = ""
-    for i in range(0, len(lst)):
-        # Add new line character if necessary
-        if i > 0:
-            lines = lines + "\n"
-        # Add item to the string
-        lines = lines + lst[i]
-    return lines
+    return "\n".join(lst)
 
 def get_time_string(dvk:Dvk=None, twelve_hour:bool=True) -> str:
     """
@@ -105,40 +102,32 @@ def get_time_string(dvk:Dvk=None, twelve_hour:bool=True) -> str:
     :rtype: str
     """
     # Check if the time published is invalid
-    if dvk is None or dvk.get_time() == "0000/00/00|00:00":
+    if dvk is None:
         return "Unknown Publication Date"
-    # Get the year
     time = dvk.get_time()
+    if time == "0000/00/00|00:00":
+        return "Unknown Publication Date"
+    # Get the date values
+    # Dvk times allow any day from 1-31, so strptime can't be used here
     year = time[0:4]
-    # Get the month
-    month_int = int(time[5:7])
-    months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-    month = months[month_int-1]
-    # Get the day
+    month = MONTHS[int(time[5:7])-1]
     day = time[8:10]
-    # Get the hour
     hour_int = int(time[11:13])
-    # Get the minute
     minute = time[14:16]
     # Get the clock string
-    clock_string = ":" + minute
+    suffix = ""
     if twelve_hour:
         # Convert 24-hour time to 12-hour clock
         if hour_int < 12:
-            clock_string = clock_string + " AM"
+            suffix = " AM"
             if hour_int == 0:
                 hour_int = 12
         else:
-            clock_string = clock_string + " PM"
+            suffix = " PM"
             if not hour_int == 12:
                 hour_int -= 12
-    clock_string = pad_num(str(hour_int), 2) + clock_string
     # Combine to form full time string
-    time_string = "Posted <b>" + day + " " + month + " " + year\
-                + " - " + clock_string + "</b>"
-    # Return the time string
-    return time_string
+    return f"Posted <b>{day} {month} {year} - {hour_int:02d}:{minute}{suffix}</b>"
 
 def is_image_extension(extension:str=None) -> bool:
     """
@@ -149,19 +138,9 @@ def is_image_extension(extension:str=None) -> bool:
     :return: Whether file extension is for an image file.
     :rtype: bool
     """
-    if (extension == ".jpg"
-            or extension == ".jpeg"
-            or extension == ".png"
-            or extension == ".gif"
-            or extension == ".svg"
-            or extension == ".webp"
-            or extension == ".apng"
-            or extension == ".avif"
-            or extension == ".jfif"
-            or extension == ".pjpeg"
-            or extension == ".pjp"):
-        return True
-    return False
+    if extension is None:
+        return False
+    return extension.lower() in IMAGE_EXTENSIONS
 
 def get_text_media_html(dvk:Dvk=None) -> str:
     """
@@ -267,12 +246,12 @@ def get_dvk_header_html(dvk:Dvk=None) -> str:
     title_tag = "<b>" + replace_reserved_characters(dvk.get_title()) + "</b>"
     title_tag = create_html_tag("div", [["id","dvk_title"]], title_tag, False)
     # Create published tag
-    pub_tag = "By <b>" + list_to_string(dvk.get_artists(), 1)\
-                + "</b>, " + get_time_string(dvk)
+    artists = list_to_string(dvk.get_artists(), 1)
+    pub_tag = f"By <b>{artists}</b>, {get_time_string(dvk)}"
     pub_tag = create_html_tag("div", [["id", "dvk_pub"]], pub_tag, False)
     # Combine into header tag
     attr = [["id", "dvk_header"], ["class", "dvk_padded"]]
-    header = create_html_tag("div", attr, title_tag + "\n" + pub_tag)
+    header = create_html_tag("div", attr, list_to_lines([title_tag, pub_tag]))
     # Return dvk_header tag
     return header
 
@@ -301,7 +280,7 @@ def get_dvk_info_html(dvk:Dvk=None) -> str:
         desc_tag = create_html_tag("div", attr, description)
     # Combine into larger dvk_info_base tag
     attr = [["id", "dvk_info_base"], ["class", "dvk_info"]]
-    info = create_html_tag("div", attr, header_tag + "\n" + desc_tag)
+    info = create_html_tag("div", attr, list_to_lines([header_tag, desc_tag]))
     # Return the dvk_info_base tag
     return info
 
@@ -323,17 +302,16 @@ def get_tag_info_html(dvk:Dvk=None) -> str:
     wt_header = create_html_tag("div", attr, wt_header, False)
     # Create web_tag_elements
     wt_elements = []
-    attr = [["class", "dvk_tag"]]
     web_tags = dvk.get_web_tags()
     for tag in web_tags:
-        element = create_html_tag("span", attr, replace_reserved_characters(tag), False)
+        element = f"<span class=\"dvk_tag\">{replace_reserved_characters(tag)}</span>"
         wt_elements.append(element)
     # Create web_tag_container
     attr = [["id", "dvk_tags"], ["class", "dvk_padded"]]
     wt_container = create_html_tag("div", attr, list_to_lines(wt_elements))
     # Create tag info container
     attr = [["id", "dvk_tag_info"], ["class", "dvk_info"]]
-    ti = create_html_tag("div", attr, wt_header + "\n" + wt_container)
+    ti = create_html_tag("div", attr, list_to_lines([wt_header, wt_container]))
     return ti
 
 def get_page_link_html(dvk:Dvk=None) -> str:
@@ -347,24 +325,23 @@ def get_page_link_html(dvk:Dvk=None) -> str:
     :rtype: str
     """
     links = []
-    cls = ["class", "dvk_link"]
     # Return empty string if Dvk is invalid
     if dvk is None:
         return ""
     # Get page URL link
     page = dvk.get_page_url()
     if page is not None:
-        link = create_html_tag("a", [cls, ["href", page]], "Page URL", False)
+        link = f"<a class=\"dvk_link\" href=\"{page}\">Page URL</a>"
         links.append(link)
     # Get direct URL link
     direct = dvk.get_direct_url()
     if direct is not None:
-        link = create_html_tag("a", [cls, ["href", direct]], "Direct URL", False)
+        link = f"<a class=\"dvk_link\" href=\"{direct}\">Direct URL</a>"
         links.append(link)
     # Get secondary URL link
     secondary = dvk.get_secondary_url()
     if secondary is not None:
-        link = create_html_tag("a", [cls, ["href", secondary]], "Secondary URL", False)
+        link = f"<a class=\"dvk_link\" href=\"{secondary}\">Secondary URL</a>"
         links.append(link)
     # Set the appropriate attributes for the number of links used
     if len(links) == 3:
@@ -642,16 +619,17 @@ def get_dvk_html(dvk:Dvk=None,
     content = list_to_lines(clean_list([media, dvk_navbar, dvk_info, tag_info, page_links]))
     dvk_content = create_html_tag("div", [["id", "dvk_content"]], content)
     # Combine into final HTML
-    html = head + "\n" + create_html_tag("body", None, dvk_content)
-    html = "<!DOCTYPE html>\n" + create_html_tag("html", None, html)
+    body = create_html_tag("body", None, dvk_content)
+    html = create_html_tag("html", None, list_to_lines([head, body]))
     # Return HTML
-    return html
+    return list_to_lines(["<!DOCTYPE html>", html])
 
 def write_dvk_html(dvk:Dvk=None,
                    filename:str=None,
                    prev_path:str=None,
                    next_path:str=None,
-                   delete:bool=True) -> str:
+                   delete:bool=True,
+                   css:str=None) -> str:
     """
     Creates an HTML file from Dvk info.
 
@@ -663,8 +641,10 @@ def write_dvk_html(dvk:Dvk=None,
     :type prev_path: str, optional
     :param next_path: Path of the next Dvk HTML in navbar, defaults to None
     :type next_path: str, optional
-    :param delete: Whether to delete the contents of temp directory before writing, defaults to False
+    :param delete: Whether to delete the contents of temp directory before writing, ignored if css is given, defaults to False
     :type delete: bool, optional
+    :param css: Path of an existing CSS file to use, creates a new one if None, defaults to None
+    :type css: str, optional
     :return: Path of the written HTML file
     :rtype: str
     """
@@ -672,21 +652,22 @@ def write_dvk_html(dvk:Dvk=None,
     if dvk is None or filename is None:
         return ""
     # Get the filename for the dvk
-    temp_dir = get_temp_directory(delete)
+    # Don't clear the temp directory if given a CSS file, since it may be stored there
+    temp_dir = get_temp_directory(delete and css is None)
     html_file = abspath(join(temp_dir, filename))
     # Get HTML for the given Dvk
-    css_file = create_css(temp_dir)
+    css_file = css
+    if css_file is None:
+        css_file = create_css(temp_dir)
     html = get_dvk_html(dvk,
                 css=css_file,
                 prev_path=prev_path,
                 next_path=next_path)
     if html == "":
         return ""
-    # Write html to disk
-    with open(html_file, "w") as out_file:
-        out_file.write(html)
-    if not exists(html_file):
-        return ""
+    # Write html to disk as UTF-8, matching the charset in the HTML head
+    with open(html_file, "wb") as out_file:
+        out_file.write(html.encode("utf-8"))
     # Return the path to the html file
     return html_file
 
@@ -705,8 +686,9 @@ def write_dvk_html_list(dvks:List[Dvk]=None, delete:bool=True) -> List[str]:
     # Return empty list if list of Dvks is invalid
     if dvks is None:
         return []
-    # Get the temporary directory
+    # Get the temporary directory and CSS file shared by every Dvk HTML
     temp_dir = get_temp_directory(delete)
+    css_file = create_css(temp_dir)
     # Get HTML for each Dvk
     size = len(dvks)
     htmls = []
@@ -724,7 +706,8 @@ def write_dvk_html_list(dvks:List[Dvk]=None, delete:bool=True) -> List[str]:
                     filename=str(i) + ".html",
                     prev_path=prev_path,
                     next_path=next_path,
-                    delete=False)
+                    delete=False,
+                    css=css_file)
         htmls.append(html)
     # Return HTML paths
     return htmls
@@ -5,14 +5,25 @@ from dvk_archive.main.color_print import color_print
 from dvk_archive.main.file.dvk import Dvk
 from dvk_archive.main.file.rename import rename_directory
 from dvk_archive.main.processing.string_processing import get_filename
-from html_string_tools.main.html_string_tools import remove_whitespace
 from os import getcwd, listdir, pardir, remove
 from os.path import abspath, basename, exists, isdir, join
 from traceback import print_exc
 from tqdm import tqdm
 from typing import List
+from re import compile as re_compile
 from re import findall
 
+# Pattern for finding lines of text, separated by new lines
+LINE_PATTERN = re_compile("[^\\n\\r]+")
+# Pattern for the field label at the start of a media data line
+FIELD_PATTERN = re_compile("(?:(?P<id>dvk_id|id|i)"
+            + "|(?P<artists>artists?|a)"
+            + "|(?P<time>time|published|time_published|p)"
+            + "|(?P<tags>web_tags|tags|t)"
+            + "|(?P<description>d|description)"
+            + "|(?P<page>page|url|page_url|u)"
+            + "|(?P<direct>direct_url|media_url|direct|media|m))\\|")
+
 def read_file_as_lines(file:str=None) -> List[str]:
     """
     Reads a given text file and separates lines into separate list entries.
@@ -27,11 +38,7 @@ def read_file_as_lines(file:str=None) -> List[str]:
         with open(file) as f:
             contents = f.read()
         # Separate into separate lines.
-        regex = "^[^\\n\\r]+(?=[\\n\\r]+)"\
-                    +"|(?<=[\\n\\r])[^\\n\\r]+(?=[\\n\\r]+)"\
-                    +"|^[^\\n\\r]+$"\
-                    +"|(?<=[\\n\\r])[^\\n\\r]+$"
-        lines = findall(regex, contents)
+        lines = LINE_PATTERN.findall(contents)
         # Return lines
         return lines
     except (FileNotFoundError, TypeError):
@@ -65,31 +72,34 @@ def get_data_dvk(file:str=None, parent_dvk:Dvk=Dvk()) -> Dvk:
     lines = read_file_as_lines(file)
     # Run through all lines
     for line in lines:
-        lower = line.lower()
-        if not len(findall("^dvk_id\\||^id\\||i\\|", lower)) == 0:
+        # Find which field the line holds with a single match
+        field = FIELD_PATTERN.match(line.lower())
+        if field is None:
+            continue
+        value = line[field.end():]
+        if field.lastgroup == "id":
             # Get dvk ID
-            data_dvk.set_dvk_id(line[line.find("|")+1:])
-        elif not len(findall("^artists?\\||^a\\|", lower)) == 0:
+            data_dvk.set_dvk_id(value)
+        elif field.lastgroup == "artists":
             # Get artists
-            data_dvk.set_artists(line[line.find("|")+1:].split(","))
-        elif not len(findall("^time\\||^published\\||^time_published\\||^p\\|", lower)) == 0:
+            data_dvk.set_artists(value.split(","))
+        elif field.lastgroup == "time":
             # Get time published
-            time = line[line.find("|")+1:]
-            data_dvk.set_time(time)
+            data_dvk.set_time(value)
             if data_dvk.get_time() == "0000/00/00|00:00":
-                data_dvk.set_time(f"{time}|00:00")
-        elif not len(findall("^web_tags\\||^tags\\||^t\\|", lower)) == 0:
+                data_dvk.set_time(f"{value}|00:00")
+        elif field.lastgroup == "tags":
             # Get web tags
-            data_dvk.set_web_tags(line[line.find("|")+1:].split(","))
-        elif not len(findall("^d\\||^description\\|", lower)) == 0:
+            data_dvk.set_web_tags(value.split(","))
+        elif field.lastgroup == "description":
             # Get description
-            data_dvk.set_description(line[line.find("|")+1:])
-        elif not len(findall("^page\\||^url\\||^page_url\\||^u\\|", lower)) == 0:
+            data_dvk.set_description(value)
+        elif field.lastgroup == "page":
             # Get page URL
-            data_dvk.set_page_url(remove_whitespace(line[line.find("|")+1:]))
-        elif not len(findall("^direct_url\\||^media_url\\||^direct\\||^media\\||^m\\|", lower)) == 0:
+            data_dvk.set_page_url(value.strip())
+        elif field.lastgroup == "direct":
             # Get direct URL
-            data_dvk.set_direct_url(remove_whitespace(line[line.find("|")+1:]))
+            data_dvk.set_direct_url(value.strip())
     # Return the data Dvk
     return data_dvk
 
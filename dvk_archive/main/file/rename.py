@@ -1,12 +1,33 @@
 #!/usr/bin/env python3
 
 from argparse import ArgumentParser
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dvk_archive.main.color_print import color_print
 from dvk_archive.main.file.dvk import Dvk
 from dvk_archive.main.file.dvk_handler import DvkHandler
-from os import getcwd, pardir
-from os.path import abspath, exists, isdir, join
+from os import getcwd
+from os.path import abspath, dirname, exists, isdir
 from tqdm import tqdm
+from typing import List
+
+def rename_dvks(dvks:List[Dvk]=None):
+    """
+    Renames a list of DVKs and associated media to their default names.
+    Renames are done in order, so DVKs should share a parent directory.
+
+    :param dvks: DVKs to be renamed, defaults to None
+    :type dvks: list[Dvk], optional
+    """
+    # TEST IF DVK LIST IS VALID
+    if dvks is not None:
+        for dvk in dvks:
+            # Get parent directory
+            parent = dirname(abspath(dvk.get_dvk_file()))
+            # RENAME DVK FILE AND ASSOCIATED MEDIA
+            dvk.rename_files(dvk.get_filename(parent, False), dvk.get_filename(parent, True))
+            # UPDATE EXTENSIONS
+            dvk.update_extensions()
 
 def rename_files(dvk_handler:DvkHandler=None):
     """
@@ -17,16 +38,17 @@ def rename_files(dvk_handler:DvkHandler=None):
     """
     # TEST IF DVK HANDLER IS VALID
     if dvk_handler is not None:
-        print("Renaming files:")
+        # GROUP DVKS BY PARENT DIRECTORY
+        groups = defaultdict(list)
         size = dvk_handler.get_size()
-        for dvk_num in tqdm(range(0, size)):
+        for dvk_num in range(0, size):
             dvk = dvk_handler.get_dvk(dvk_num)
-            # Get parent directory
-            parent = abspath(join(abspath(dvk.get_dvk_file()), pardir))
-            # RENAME DVK FILE AND ASSOCIATED MEDIA
-            dvk.rename_files(dvk.get_filename(parent, False), dvk.get_filename(parent, True))
-            # UPDATE EXTENSIONS
-            dvk.update_extensions()
+            groups[dirname(abspath(dvk.get_dvk_file()))].append(dvk)
+        # RENAME DIRECTORIES IN PARALLEL
+        # DVKS IN THE SAME DIRECTORY ARE RENAMED IN ORDER TO AVOID NAME CONFLICTS
+        print("Renaming files:")
+        with ThreadPoolExecutor() as executor:
+            list(tqdm(executor.map(rename_dvks, groups.values()), total=len(groups)))
 
 def rename_directory(directory:str=None):
     """
@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 
-from _functools import cmp_to_key
 from argparse import ArgumentParser
 from dvk_archive.main.color_print import color_print
 from dvk_archive.main.file.dvk_handler import Dvk
 from dvk_archive.main.file.dvk_handler import DvkHandler
 from dvk_archive.main.processing.list_processing import clean_list
-from dvk_archive.main.processing.string_compare import compare_alphanum
+from dvk_archive.main.processing.string_compare import get_alphanum_key
 from dvk_archive.main.processing.string_processing import pad_num
-from os import getcwd, pardir
-from os.path import abspath, basename, exists, isdir, join
+from os import getcwd
+from os.path import abspath, basename, dirname, exists, isdir
 from tqdm import tqdm
 from typing import List
 
@@ -85,7 +84,9 @@ def set_sequence(dvks:List[Dvk], seq_title:str=None) -> List[Dvk]:
         sequenced[i] = edit_dvk
     return sequenced
 
-def get_sequence(dvk_handler:DvkHandler=None, index:int=None) -> List[int]:
+def get_sequence(dvk_handler:DvkHandler=None,
+                index:int=None,
+                id_indexes:dict=None) -> List[int]:
     """
     Gets a group of Dvks in a sequence from a given starting index.
 
@@ -93,6 +94,8 @@ def get_sequence(dvk_handler:DvkHandler=None, index:int=None) -> List[int]:
     :type dvk_handler: DvkHandler, optional
     :param index: Index of a Dvk in she sequence, defaults to None
     :type index: int, optional
+    :param id_indexes: Dvk indexes from DvkHandler.get_id_indexes, defaults to None
+    :type id_indexes: dict, optional
     :return: List of indexes for the Dvks in the sequence
     :rtype: list[int]
     """
@@ -104,7 +107,10 @@ def get_sequence(dvk_handler:DvkHandler=None, index:int=None) -> List[int]:
         while not dvk.is_last() and dvk.get_next_id() is not None:
             # Get next Dvk
             next_id = dvk.get_next_id()
-            cur_index = dvk_handler.get_dvk_by_id(next_id)
+            if id_indexes is None:
+                cur_index = dvk_handler.get_dvk_by_id(next_id)
+            else:
+                cur_index = id_indexes.get(next_id.upper(), -1)
             if cur_index == -1 or cur_index in next_ids:
                 # Stop if Dvk doesn't exist or is already in sequence
                 break
@@ -116,7 +122,10 @@ def get_sequence(dvk_handler:DvkHandler=None, index:int=None) -> List[int]:
         while not dvk.is_first() and dvk.get_prev_id() is not None:
             # Get prev Dvk
             prev_id = dvk.get_prev_id()
-            cur_index = dvk_handler.get_dvk_by_id(prev_id)
+            if id_indexes is None:
+                cur_index = dvk_handler.get_dvk_by_id(prev_id)
+            else:
+                cur_index = id_indexes.get(prev_id.upper(), -1)
             if cur_index == -1 or cur_index in ids:
                 # Stop if Dvk doesn't exist or is already in sequence
                 break
@@ -150,14 +159,13 @@ def get_default_sequence_order(dvk_handler:DvkHandler=None, respect_seq:bool=Tru
     size = dvk_handler.get_size()
     parents = []
     for i in range(0, size):
-        parent = abspath(join(dvk_handler.get_dvk(i).get_dvk_file(), pardir))
+        parent = dirname(abspath(dvk_handler.get_dvk(i).get_dvk_file()))
         parents.append(str(parent))
     # Get list of unique parent directories
     directories = []
     directories.extend(parents)
     directories = clean_list(directories)
-    comparator = cmp_to_key(compare_alphanum)
-    directories = sorted(directories, key=comparator)
+    directories = sorted(directories, key=get_alphanum_key)
     # Add Dvks by directory
     indexes = []
     for directory in directories:
@@ -168,9 +176,10 @@ def get_default_sequence_order(dvk_handler:DvkHandler=None, respect_seq:bool=Tru
     # Get sequence order, if specified
     if respect_seq:
         new_indexes = []
+        id_indexes = dvk_handler.get_id_indexes()
         while len(indexes) > 0:
             # Add sequence to indexes
-            seq = get_sequence(dvk_handler, indexes[0])
+            seq = get_sequence(dvk_handler, indexes[0], id_indexes)
             if len(seq) > 1:
                 seq.extend(new_indexes)
                 new_indexes = []
@@ -236,12 +245,12 @@ def separate_into_sections(dvk_handler:DvkHandler=None, respect_seq:bool=True, k
     if len(dvks) == 0:
         return []
     # Separate Dvks into sections based on their parent directory
-    path = abspath(join(dvks[0].get_dvk_file(), pardir))
+    path = dirname(abspath(dvks[0].get_dvk_file()))
     group = [False]
     sections = []
     for dvk in dvks:
         # Check if parent matches the path of the last
-        parent = abspath(join(dvk.get_dvk_file(), pardir))
+        parent = dirname(abspath(dvk.get_dvk_file()))
         if not path == parent:
             # Start a new group
             sections.append(group)
@@ -292,7 +301,7 @@ def user_create_standalone(directory:str=None) -> bool:
             # Set Dvk as a standalone media file
             dvks = set_sequence(dvks)
             # Rename file
-            parent = abspath(join(abspath(dvk.get_dvk_file()), pardir))
+            parent = dirname(abspath(dvk.get_dvk_file()))
             dvk.rename_files(dvk.get_filename(parent, False), dvk.get_filename(parent, True))
         color_print("Finished writing sequence data!", "g")
         return True
@@ -337,7 +346,7 @@ def user_create_sequence(directory:str=None, respect_seq:bool=True, keep_section
             sec_title = None
             if not section[0]:
                 # Only ask the user for a section title if needed
-                path = abspath(join(section[1].get_dvk_file(), pardir))
+                path = dirname(abspath(section[1].get_dvk_file()))
                 show = "Section Title for: " + basename(path) + " (q to cancel):"
                 sec_title = str(input(show))
                 if sec_title == "q":
@@ -358,7 +367,7 @@ def user_create_sequence(directory:str=None, respect_seq:bool=True, keep_section
     dvks = set_sequence(dvks, seq_title)
     # Renmame files
     for dvk in dvks:
-        parent = abspath(join(abspath(dvk.get_dvk_file()), pardir))
+        parent = dirname(abspath(dvk.get_dvk_file()))
         dvk.rename_files(dvk.get_filename(parent, False), dvk.get_filename(parent, True))
     color_print("Finished writing sequence!", "g")
     return True
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from html_string_tools.main.html_string_tools import remove_whitespace
 from html import unescape
 from typing import List
 from re import findall
@@ -64,7 +63,7 @@ def clean_element(html:str=None, remove_ends:str=False) -> str:
         text = text.replace(">  ", "> ")
     # REMOVE HEADER AND FOOTER, IF SPECIFIED
     if remove_ends:
-        text = remove_whitespace(text)
+        text = text.strip()
         # REMOVE HEADER
         if len(text) > 0 and text[0] == "<":
             start = text.find(">")
@@ -76,7 +75,7 @@ def clean_element(html:str=None, remove_ends:str=False) -> str:
             if not end == -1:
                 text = text[0:end]
     # REMOVE WHITESPACE FROM THE START AND END OF STRING
-    text = remove_whitespace(text)
+    text = text.strip()
     return text
 
 def remove_html_tags(text:str=None) -> str:
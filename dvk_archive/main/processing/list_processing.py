@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-from html_string_tools.main.html_string_tools import remove_whitespace as rw
 from html_string_tools.main.html_string_tools import replace_reserved_characters as rrc
 from re import sub as re_sub
 from typing import List
@@ -29,7 +28,7 @@ def clean_list(lst:List[str]=None, remove_whitespace:bool=True) -> List[str]:
         if remove_whitespace:
             size = len(out)
             for i in range(0, size):
-                out[i] = rw(out[i])
+                out[i] = out[i].strip()
         # Remove entries with blank value
         while True:
             try:
@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
+from re import compile as re_compile
 from re import findall
 
+# Matches the first section of a string, as returned by get_section
+SECTION_PATTERN = re_compile("(?P<number>[0-9]*[.,]{0,1}[0-9]+)"
+            + "|[^0-9]+(?=[.,][0-9]+|(?<=[^,.])[0-9]|$)")
+DIGIT_PATTERN = re_compile("[0-9]")
+
 def compare_strings(str1:str=None, str2:str=None) -> int:
     """
     Compares two strings alphabetically.
@@ -119,3 +125,40 @@ def compare_alphanum(str1:str=None, str2:str=None):
         end2 = end2[len(section2):]
         result = compare_sections(section1, section2)
     return result
+
+def get_alphanum_key(input_str:str=None) -> tuple:
+    """
+    Returns a sort key for ordering strings alphabetically and numerically.
+    Keys sort in the same order as compare_alphanum.
+    Not case sensitive.
+
+    :param input_str: Given string, defaults to None
+    :type input_str: str, optional
+    :return: Sort key for the given string
+    :rtype: tuple
+    """
+    # Return empty key if string is invalid or empty
+    if input_str is None or input_str == "":
+        return ()
+    # Strings without digits are a single text section
+    if DIGIT_PATTERN.search(input_str) is None:
+        return ((input_str.upper(), 0.0, ""),)
+    # Break into sections and get a key for each section
+    key = []
+    index = 0
+    while index < len(input_str):
+        match = SECTION_PATTERN.match(input_str, index)
+        if match is None:
+            break
+        section = match.group(0)
+        index = match.end()
+        if match.group("number") is not None:
+            # Number sections sort before text starting with letters
+            value = float(section.replace(",", "."))
+            extra = ""
+            if len(section) > 10:
+                extra = section
+            key.append(("0", value, extra))
+        else:
+            key.append((section.upper(), 0.0, ""))
+    return tuple(key)
@@ -1,8 +1,21 @@
 #!/usr/bin/env python3
 
+from functools import lru_cache
 from math import floor
 from os.path import abspath
-from re import findall, sub
+from re import compile as re_compile
+
+# Maps accented characters to their nearest ASCII equivalents
+ACCENT_TABLE = str.maketrans(
+    "ÀÁÂÃÄÅÈÉÊËÌÍÎÏÒÓÔÕÖÙÚÛÜàáâãäåèéêëìíîïòóôõöùúûüýÿÑÝñ",
+    "AAAAAAEEEEIIIIOOOOOUUUUaaaaaaeeeeiiiiooooouuuuyyNYn")
+# Patterns for cleaning filenames
+NON_ALPHANUM_PATTERN = re_compile("[^a-zA-Z0-9 ]")
+HYPHENS_PATTERN = re_compile("-{2,}")
+SPACES_PATTERN = re_compile(" {2,}")
+HANGING_HYPHEN_PATTERN = re_compile("(?<= )-(?=[a-zA-Z0-9])|(?<=[a-zA-Z0-9])-(?= )")
+# Pattern for finding file extensions, with or without a following query string
+EXTENSION_PATTERN = re_compile("\\.[a-zA-Z0-9]{1,5}\\?|\\.[a-zA-Z0-9]{1,5}$")
 
 def pad_num(num:str=None, length:int=0) -> str:
     """
@@ -20,10 +33,7 @@ def pad_num(num:str=None, length:int=0) -> str:
     if num is None or length < 1:
         return ""
     # Pad out the string with zeros to reach the given string length
-    new_num = num
-    while len(new_num) < length:
-        new_num = f"0{new_num}"
-    return new_num
+    return num.rjust(length, "0")
 
 
 def truncate_string(text:str=None, length:int=90) -> str:
@@ -53,31 +63,28 @@ def truncate_string(text:str=None, length:int=90) -> str:
     else:
         index = floor(len(text)/2)
     # DELETE CHARACTERS FROM THE INDEX POSITION
-    out = text
-    if index < len(out) - index:
+    # SLICES OUT THE WHOLE DELETED SECTION AT ONCE
+    size = len(text)
+    if index < size - index:
         index = index + 1
-        while index < len(out) and length < len(out):
-            out = out[:index] + out[index+1:]
+        removed = min(size - length, size - index)
+        out = text[:index] + text[index+removed:]
     else:
-        index = index - 1;
-        while index > -1 and len(out) > length:
-            out = out[:index] + out[index+1:]
-            index = index - 1
+        removed = min(size - length, index)
+        index = index - removed
+        out = text[:index] + text[index+removed:]
+        # REMOVE DUPLICATE SPACER LEFT AT THE BREAK POINT
+        index = index - 1
         if (index > -1
                 and index < len(out) -1
                 and out[index] == out[index+1]
                 and (out[index] == " " or out[index] == "-")):
             out = out[:index] + out[index+1:]
     # IF STILL TOO LONG, REMOVE CHARACTERS FROM THE END OF THE STRING
-    if len(out) > length:
-        out = out[:length]
-    # REMOVE START AND END SPACERS
-    while len(out) > 0 and (out[0] == " " or out[0] == "-"):
-        out = out[1:]
-    while len(out) > 0 and (out[len(out)-1] == " " or out[len(out)-1] == "-"):
-        out = out[:-1]
-    return out
+    # THEN REMOVE START AND END SPACERS
+    return out[:length].strip(" -")
 
+@lru_cache(maxsize=8192)
 def get_filename(text:str=None, length:int=90) -> str:
     """
     Returns a version of a given String that is safe for use as a filename.
@@ -92,30 +99,25 @@ def get_filename(text:str=None, length:int=90) -> str:
     # If given string is invalid, return string "0"
     if text is None:
         return "0"
+    # Return text unchanged if it is already a clean filename of valid length
+    if ((length == -1 or len(text) <= length)
+            and text.isascii()
+            and text.replace(" ", "").isalnum()
+            and "  " not in text
+            and not text.startswith(" ")
+            and not text.endswith(" ")):
+        return text
     # Replace accented characters with nearest ASCII equivalents
-    new_text = sub("[À-Å]", "A", text)
-    new_text = sub("[È-Ë]", "E", new_text)
-    new_text = sub("[Ì-Ï]", "I", new_text)
-    new_text = sub("[Ò-Ö]", "O", new_text)
-    new_text = sub("[Ù-Ü]", "U", new_text)
-    new_text = sub("[à-å]", "a", new_text)
-    new_text = sub("[è-ë]", "e", new_text)
-    new_text = sub("[ì-ï]", "i", new_text)
-    new_text = sub("[ò-ö]", "o", new_text)
-    new_text = sub("[ù-ü]", "u", new_text)
-    new_text = sub("[ýÿ]", "y", new_text)
-    new_text = new_text.replace("Ñ", "N")
-    new_text = new_text.replace("Ý", "Y")
-    new_text = new_text.replace("ñ", "n")
+    new_text = text.translate(ACCENT_TABLE)
     # Replace all non-alphanumeric characters with hyphens
-    new_text = sub("[^a-zA-Z0-9 ]", "-", new_text)
-    # Remove whitespace and hyphens at begining and end of text
-    new_text = sub("^[\\s-]+|[\\s-]+$", "", new_text)
+    new_text = NON_ALPHANUM_PATTERN.sub("-", new_text)
+    # Remove spaces and hyphens at begining and end of text
+    new_text = new_text.strip(" -")
     # Remove duplicate spacers
-    new_text = sub("-{2,}", "-", new_text)
-    new_text = sub(" {2,}", " ", new_text)
+    new_text = HYPHENS_PATTERN.sub("-", new_text)
+    new_text = SPACES_PATTERN.sub(" ", new_text)
     # Remove hanging hyphens
-    new_text = sub("(?<= )-(?=[a-zA-Z0-9])|(?<=[a-zA-Z0-9])-(?= )", "", new_text)
+    new_text = HANGING_HYPHEN_PATTERN.sub("", new_text)
     # Truncate string
     if length != -1:
         new_text = truncate_string(new_text, length)
@@ -125,6 +127,7 @@ def get_filename(text:str=None, length:int=90) -> str:
         return "0"
     return new_text
 
+@lru_cache(maxsize=8192)
 def get_url_directory(url:str=None) -> str:
     """
     Returns the last sub-directory for a given URL.
@@ -137,11 +140,32 @@ def get_url_directory(url:str=None) -> str:
     # Return empty string if url is invalid
     if url is None:
         return ""
-    # Remove last forward slash from the URL
-    main = sub("\\/+$", "", url)
-    # Get last sub-directory
-    last = main.rfind("/") + 1
-    return main[last:]
+    # Remove trailing forward slashes and get the last sub-directory
+    return url.rstrip("/").rpartition("/")[2]
+
+@lru_cache(maxsize=8192)
+def get_extension(path:str=None) -> str:
+    """
+    Returns the extension for a given filename or direct file URL.
+    If extension does not exist, returns empty.
+
+    :param path: Given path with extension, defaults to None
+    :type path: str, optional
+    :return: Extension for the path
+    :rtype: str
+    """
+    # Return empty string if path is invalid or has no extension
+    if path is None or "." not in path:
+        return ""
+    # Find potential extensions
+    matches = EXTENSION_PATTERN.findall(path)
+    if len(matches) == 0:
+        return ""
+    # Use the last extension before a query string, if there is one
+    for match in reversed(matches):
+        if match.endswith("?"):
+            return match[:-1]
+    return matches[0]
 
 def truncate_path(parent:str=None, file:str=None) -> str:
     # Return empty string if file is invalid
@@ -3,17 +3,65 @@
 from binascii import a2b_base64
 from binascii import Error as BinError
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from dvk_archive.main.color_print import color_print
-from dvk_archive.main.processing.string_processing import pad_num
-from io import BytesIO
+from http.cookiejar import DefaultCookiePolicy
 from json import loads
+from os import remove
 from os.path import abspath, exists
-from re import findall
+from re import compile as re_compile
 from requests import exceptions
 from requests import Response
 from requests import Session
-from shutil import copyfileobj
+from requests.adapters import HTTPAdapter
+from shutil import move
+from typing import List
 from urllib.error import HTTPError
+from urllib3.util.retry import Retry
+
+# Patterns for parsing data URIs
+DATA_URI_PARAMS_PATTERN = re_compile("(?<=[:;])[^;:,]+(?=[,;])")
+DATA_URI_DATA_PATTERN = re_compile("(?<=,).+")
+# Pattern for parsing day, month, year, hour, and minute from a Last-Modified header
+LAST_MODIFIED_PATTERN = re_compile(
+    "^.{5}([0-9]{2}) ([A-Za-z]{3}) ([0-9]{4}) ([0-9]{2}):([0-9]{2})")
+# Month numbers for lowercase Last-Modified month abbreviations
+MONTHS = {"jan":"01", "feb":"02", "mar":"03", "apr":"04", "may":"05", "jun":"06",
+          "jul":"07", "aug":"08", "sep":"09", "oct":"10", "nov":"11", "dec":"12"}
+
+# Seconds to wait when connecting and when reading a response
+TIMEOUT = (10, 60)
+
+def create_session() -> Session:
+    """
+    Creates a requests Session that keeps connections alive between requests.
+    Retries connection failures and server errors with backoff.
+    Once retries run out, the last server error response is returned as normal.
+    Cookies aren't kept between requests, so each request starts with no cookies.
+
+    :return: Session with pooled connections
+    :rtype: Session
+    """
+    retry = Retry(total=3, connect=1, backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session = Session()
+    # Don't store cookies from responses, only reuse connections
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Shared session, so requests to the same host reuse connections
+SESSION = create_session()
+
+def close_session():
+    """
+    Closes all pooled connections held by the shared session.
+    """
+    SESSION.cookies.clear()
+    SESSION.close()
 
 def get_default_headers() -> dict:
     """
@@ -42,15 +90,14 @@ def get_direct_response(url:str=None, headers:dict=None, data:dict=None) -> Resp
     # Return None if URL is invalid
     if url is None or url == "":
         return None
-    session = Session()
     try:
         # Send request
         if data is None:
             # Send GET request if there is no POST data
-            response = session.get(url, headers=headers)
+            response = SESSION.get(url, headers=headers, timeout=TIMEOUT)
         else:
             # Send POST request if POST data is provided
-            response = session.post(url, data=data)
+            response = SESSION.post(url, data=data, timeout=TIMEOUT)
         return response
     except:
         return None
@@ -141,9 +188,9 @@ def convert_data_uri(data_uri:str=None, filepath:str=None) -> str:
     """
     try:
         # Get data URI parameters
-        params = findall("(?<=[:;])[^;:,]+(?=[,;])", data_uri)
+        params = DATA_URI_PARAMS_PATTERN.findall(data_uri)
         # Get data from URI
-        data = findall("(?<=,).+", data_uri)[0]
+        data = DATA_URI_DATA_PATTERN.findall(data_uri)[0]
         if "base64" in params:
             # Convert ASCII data to binary data
             binary = a2b_base64(data)
@@ -168,31 +215,58 @@ def download(url:str=None, file_path:str=None) -> dict:
     :return: Headers retrieved from the given media URL
     :rtype: dict
     """
+    part_file = None
     try:
         file = abspath(file_path)
         # Convert URI if it is a data URI
         if url.startswith("data:"):
             convert_data_uri(url, file_path)
             return dict()
-        # Try downloading normally
-        session = Session()
+        # Try downloading normally, streaming the response to the file
         headers = get_default_headers()
-        response = session.get(url, headers=headers)
-        byte_obj = BytesIO(response.content)
-        byte_obj.seek(0)
-        with open(file, "wb") as f:
-            copyfileobj(byte_obj, f)
-        return response.headers
+        # Write to a partial file first, so failed transfers never replace the file
+        part_file = file + ".part"
+        with SESSION.get(url, headers=headers, stream=True, timeout=TIMEOUT) as response:
+            with open(part_file, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1048576):
+                    f.write(chunk)
+            move(part_file, file)
+            return response.headers
     except (AttributeError,
                 HTTPError,
-                exceptions.ConnectionError,
-                exceptions.MissingSchema,
+                exceptions.RequestException,
                 ConnectionResetError,
                 TypeError):
         if url is not None:
             color_print("Failed to download:" + url, "r")
+    finally:
+        # Delete any partially downloaded file
+        if part_file is not None and exists(part_file):
+            remove(part_file)
     return dict()
 
+def download_many(urls:List[str]=None, file_paths:List[str]=None, workers:int=16) -> List[dict]:
+    """
+    Downloads files from given URLs to given files, running downloads in parallel.
+
+    :param urls: Given URLs, defaults to None
+    :type urls: list[str], optional
+    :param file_paths: Given file paths, one for each URL, defaults to None
+    :type file_paths: list[str], optional
+    :param workers: Maximum number of simultaneous downloads, defaults to 16
+    :type workers: int, optional
+    :return: Headers retrieved from each media URL, in the order given
+    :rtype: list[dict]
+    """
+    # Return empty list if parameters are invalid
+    if urls is None or file_paths is None or not len(urls) == len(file_paths):
+        return []
+    if len(urls) == 0:
+        return []
+    # Download files, reusing connections from the shared session
+    with ThreadPoolExecutor(max_workers=min(workers, len(urls))) as executor:
+        return list(executor.map(download, urls, file_paths))
+
 def get_last_modified(headers:dict=None) -> str:
     """
     Returns the time a webpage was last modified from its response headers.
@@ -210,28 +284,12 @@ def get_last_modified(headers:dict=None) -> str:
     except KeyError:
         return ""
     # Get publication time
-    try:
-        day = int(modified[5:7])
-        month_str = modified[8:11].lower()
-        year = int(modified[12:16])
-        hour = int(modified[17:19])
-        minute = int(modified[20:22])
-        # Get month
-        months = [
-            "jan", "feb", "mar", "apr", "may", "jun",
-            "jul", "aug", "sep", "oct", "nov", "dec"]
-        month = 0
-        while month < 12:
-            if month_str == months[month]:
-                break
-            month += 1
-        month += 1
-        if month > 12:
-            return ""
-        time = pad_num(str(year), 4) + "/" + pad_num(str(month), 2) + "/"
-        time = time + pad_num(str(day), 2) + "|" + pad_num(str(hour), 2)
-        time = time + ":" + pad_num(str(minute), 2)
-        return time
-    except ValueError:
-        # Returns empty string if getting time fails
+    match = LAST_MODIFIED_PATTERN.match(modified)
+    if match is None:
+        return ""
+    day, month_str, year, hour, minute = match.groups()
+    # Get month
+    month = MONTHS.get(month_str.lower())
+    if month is None:
         return ""
+    return f"{year}/{month}/{day}|{hour}:{minute}"
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 
 from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from dvk_archive.main.processing.string_processing import get_url_directory
+from atexit import register
+from functools import lru_cache
 from json import loads
 from os import listdir, mkdir, remove
 from os.path import abspath, exists, join
+from queue import Empty, Full, Queue
 from selenium import webdriver
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
@@ -17,6 +21,25 @@ from tempfile import gettempdir
 from time import sleep
 from traceback import print_exc
 
+# Maximum number of idle Selenium drivers kept for reuse in each pool
+DRIVER_POOL_SIZE = 2
+# Warm Selenium drivers that can be reused, separated by headless mode
+DRIVER_POOLS = {True:Queue(maxsize=DRIVER_POOL_SIZE),
+                False:Queue(maxsize=DRIVER_POOL_SIZE)}
+
+def quit_driver(driver:webdriver=None):
+    """
+    Quits a given Selenium driver, ignoring drivers that already stopped.
+
+    :param driver: Selenium driver to quit, defaults to None
+    :type driver: webdriver, optional
+    """
+    if driver is not None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
 def print_driver_instructions():
     """
     Print instructions for installing Selenium drivers.
@@ -32,27 +55,71 @@ def print_driver_instructions():
     print("(On Windows, find PATH with command \"echo %PATH%\" )")
     print("(On Mac/Linux, find PATH with command \"echo $PATH\" )")
 
+@lru_cache(maxsize=128)
+def get_element_condition(xpath:str=None):
+    """
+    Returns a condition for waiting until elements matching an XPATH are loaded.
+    Conditions are cached, since they are reused across page loads.
+
+    :param xpath: XPATH of the elements to wait for, defaults to None
+    :type xpath: str, optional
+    :return: Condition for use with WebDriverWait
+    :rtype: function
+    """
+    return EC.presence_of_all_elements_located((By.XPATH, xpath))
+
 class HeavyConnect:
 
-    def __init__(self, headless:bool=True):
+    def __init__(self, headless:bool=True, reuse:bool=False):
         """
         Initialize the HeavyConnect class.
+        The Selenium driver isn't started until it is first needed.
+
+        If reuse is set, the driver is taken from and returned to a shared pool.
+        Pooled drivers keep cookies and storage between HeavyConnect instances,
+        except for the site that was open when the driver was returned.
+
+        :param headless: Whether to run in headless mode, defaults to True
+        :type headless: bool, optional
+        :param reuse: Whether to reuse pooled Selenium drivers, defaults to False
+        :type reuse: bool, optional
         """
-        self.initialize_driver(headless)
+        self.headless = headless
+        self.reuse = reuse
+        self.initialized = False
+        self.driver = None
+        # Set up temporary directory
+        self.tempdir = abspath(gettempdir())
+        self.tempdir = abspath(join(self.tempdir, "dvk_connection"))
+        if not exists(self.tempdir):
+            mkdir(self.tempdir)
 
     def initialize_driver(self, headless:bool=True):
         """
         Starts the Selenium driver.
+        If set to reuse drivers, takes a pooled driver instead if one is available.
 
         :param headless: Whether to run in headless mode, defaults to True
         :type headless: bool, optional
         """
+        self.headless = headless
+        self.initialized = True
+        # Check out a warm driver from the pool, if reusing drivers
+        pool = DRIVER_POOLS[headless]
+        while self.reuse:
+            try:
+                driver = pool.get_nowait()
+            except Empty:
+                break
+            try:
+                # Check that the pooled driver's browser is still running
+                driver.current_url
+                self.driver = driver
+                self.get_download_dir()
+                return
+            except Exception:
+                quit_driver(driver)
         try:
-            # Set up temporary directory
-            self.tempdir = abspath(gettempdir())
-            self.tempdir = abspath(join(self.tempdir, "dvk_connection"))
-            if not exists(self.tempdir):
-                mkdir(self.tempdir)
             # Create Firefox driver
             options = FO()
             options.headless = headless
@@ -70,6 +137,22 @@ class HeavyConnect:
             self.driver = None
             print_driver_instructions()
 
+    @staticmethod
+    def shutdown_pool():
+        """
+        Quits all the pooled Selenium drivers.
+        """
+        for pool in DRIVER_POOLS.values():
+            while True:
+                try:
+                    quit_driver(pool.get_nowait())
+                except Empty:
+                    break
+        # Try getting and deleting geckodriver log.
+        log_file = abspath("geckodriver.log")
+        if exists(log_file):
+            remove(log_file)
+
     def get_download_dir(self) -> str:
         """
         Creates and returns a directory for storing downloaded files.
@@ -86,7 +169,8 @@ class HeavyConnect:
     def get_page(self,
                     url:str=None,
                     element:str=None,
-                    timeout:int=20) -> BeautifulSoup:
+                    timeout:int=20,
+                    parse_only:SoupStrainer=None) -> BeautifulSoup:
         """
         Connects to a URL and returns a BeautifulSoup object.
         Capable of loading JavaScript, AJAX, etc.
@@ -97,11 +181,13 @@ class HeavyConnect:
         :type element: str, optional
         :param timeout: Seconds before timeout, defaults to 10
         :type timeout: int, optional
+        :param parse_only: Only parse page elements that match, defaults to None
+        :type parse_only: SoupStrainer, optional
         :return: BeautifulSoup object for the web page
         :rtype: BeautifulSoup
         """
         # Return None if URL or loaded driver are invalid
-        if url is None or url == "" or self.driver is None:
+        if url is None or url == "" or self.get_driver() is None:
             return None
         # Attempt loading web page
         try:
@@ -116,10 +202,10 @@ class HeavyConnect:
             # Wait for element to load, if specified
             if element is not None and not element == "":
                 WebDriverWait(self.driver, timeout).until(
-                     EC.presence_of_all_elements_located((By.XPATH, element)))
+                     get_element_condition(element))
             else:
                 sleep(timeout)
-            bs = BeautifulSoup(self.driver.page_source, "lxml")
+            bs = BeautifulSoup(self.driver.page_source, "lxml", parse_only=parse_only)
             return bs
         except:
             return None
@@ -134,7 +220,7 @@ class HeavyConnect:
         :return: Dictionary with JSON data
         :rtype: dict
         """
-        bs = self.get_page("view-source:" + str(url), "//pre")
+        bs = self.get_page("view-source:" + str(url), "//pre", parse_only=SoupStrainer("pre"))
         try:
             element = bs.find("pre")
             html = element.get_text()
@@ -146,25 +232,63 @@ class HeavyConnect:
 
     def get_driver(self) -> webdriver:
         """
-        Returns the current Selenium Web Driver
+        Returns the current Selenium Web Driver.
+        Starts the driver if it hasn't been started yet.
 
         :return: Selenium Web Driver
         :rtype: webdriver
         """
+        if not self.initialized:
+            self.initialize_driver(self.headless)
         return self.driver
 
     def close_driver(self):
         """
         Closes the Selenium driver if possible.
+        If set to reuse drivers, returns the driver to the pool instead.
+        Pooled drivers are quit with shutdown_pool or when the program exits.
         """
+        if self.reuse:
+            self.release_driver()
+            return
         # Close the Selenium driver
         if self.driver is not None:
             self.driver.close()
+            self.driver = None
+        self.initialized = False
         # Try getting and deleting geckodriver log.
         log_file = abspath("geckodriver.log")
         if exists(log_file):
             remove(log_file)
 
+    def release_driver(self):
+        """
+        Returns the Selenium driver to the pool for reuse by another HeavyConnect.
+        Quits the driver instead if the pool is already full.
+
+        Only cookies and storage for the current page's site are cleared.
+        Cookies and storage from other sites visited with the driver are kept
+        for the next HeavyConnect that reuses it.
+        """
+        if self.driver is not None:
+            try:
+                # Clear the current site's cookies and storage, then leave the page
+                self.driver.delete_all_cookies()
+                self.driver.execute_script(
+                        "window.localStorage.clear();window.sessionStorage.clear();")
+            except Exception:
+                pass
+            try:
+                self.driver.get("about:blank")
+                DRIVER_POOLS[self.headless].put_nowait(self.driver)
+            except Full:
+                quit_driver(self.driver)
+            except Exception:
+                # Quit the driver if it is no longer usable
+                quit_driver(self.driver)
+            self.driver = None
+        self.initialized = False
+
     def download(self, url:str=None, file_path:str=None) -> dict:
         """
         Downloads a file from given URL to given file.
@@ -180,9 +304,10 @@ class HeavyConnect:
             # Check if parameters are valid
             assert url is not None
             assert file_path is not None
+            assert self.get_driver() is not None
             # Get download directory
             directory = self.get_download_dir()
-            bs = self.get_page(url, "//img")
+            bs = self.get_page(url, "//img", parse_only=SoupStrainer("img"))
             new_url = str(bs.find("img")["src"])
             # Download file to temporary download directory
             js_command = "var link = document.createElement(\"a\");"\
@@ -211,3 +336,5 @@ class HeavyConnect:
             move(file, abspath(file_path))
         except:
             self.get_download_dir()
+
+register(HeavyConnect.shutdown_pool)
@@ -3,7 +3,7 @@
 from dvk_archive.main.file.dvk import Dvk
 from dvk_archive.test.temp_dir import get_test_dir
 from os import mkdir
-from os.path import abspath, join
+from os.path import join
 
 def create_test_files() -> str:
     """
@@ -14,25 +14,25 @@ def create_test_files() -> str:
     """
     # CREATE TEST DIRECTORIES
     test_dir = get_test_dir()
-    no_dvks = abspath(join(test_dir, "no_dvks"))
-    main_sub = abspath(join(test_dir, "main_sub"))
+    no_dvks = join(test_dir, "no_dvks")
+    main_sub = join(test_dir, "main_sub")
     mkdir(no_dvks)
     mkdir(main_sub)
     # CREATE UNLINKED FILES
-    with open(abspath(join(test_dir, "unlinked_main.txt")), "w") as out_file:
+    with open(join(test_dir, "unlinked_main.txt"), "w") as out_file:
         out_file.write("MAIN")
-    with open(abspath(join(main_sub, "unlinked_sub.png")), "w") as out_file:
+    with open(join(main_sub, "unlinked_sub.png"), "w") as out_file:
         out_file.write("SUB")
-    with open(abspath(join(no_dvks, "unlinked_no_dvk.jpg")), "w") as out_file:
+    with open(join(no_dvks, "unlinked_no_dvk.jpg"), "w") as out_file:
         out_file.write("NO DVK")
     # CREATE MEDIA FILES TO BE LINKED BY DVK FILES
-    with open(abspath(join(test_dir, "valid_media.png")), "w") as out_file:
+    with open(join(test_dir, "valid_media.png"), "w") as out_file:
         out_file.write("VALID")
-    with open(abspath(join(test_dir, "mm_second.txt")), "w") as out_file:
+    with open(join(test_dir, "mm_second.txt"), "w") as out_file:
         out_file.write("MISSING SECOND")
-    with open(abspath(join(main_sub, "valid_second.png")), "w") as out_file:
+    with open(join(main_sub, "valid_second.png"), "w") as out_file:
         out_file.write("VALID SECOND")
-    with open(abspath(join(main_sub, "linked.txt")), "w") as out_file:
+    with open(join(main_sub, "linked.txt"), "w") as out_file:
         out_file.write("LINKED")
     # CREATE DVKS IN THE MAIN DIRECTORY
     missing_media_dvk = Dvk()
@@ -4,8 +4,7 @@ from dvk_archive.main.file.dvk import Dvk
 from dvk_archive.main.file.dvk_handler import DvkHandler
 from dvk_archive.main.error_finding.missing_sequence_info import get_missing_sequence_info
 from dvk_archive.test.temp_dir import get_test_dir
-from os import pardir
-from os.path import abspath, basename, join
+from os.path import abspath, basename, dirname, join
 
 def test_get_missing_sequence_info():
     """
@@ -76,7 +75,7 @@ def test_get_missing_sequence_info():
     # Test finding dvks with missing sequence info
     paths = get_missing_sequence_info(test_dir)
     assert len(paths) == 3
-    assert abspath(join(paths[0], pardir)) == abspath(test_dir)
+    assert dirname(paths[0]) == abspath(test_dir)
     assert basename(paths[0]) == "missing_both.dvk"
     assert basename(paths[1]) == "missing_first.dvk"
     assert basename(paths[2]) == "missing_last.dvk"
@@ -2,8 +2,7 @@
 
 from dvk_archive.main.error_finding.same_ids import get_same_ids
 from dvk_archive.test.error_finding.error_files import create_test_files
-from os import pardir
-from os.path import abspath, basename, join
+from os.path import basename, dirname, join
 
 def test_get_same_ids():
     """
@@ -11,21 +10,21 @@ def test_get_same_ids():
     """
     test_dir = create_test_files()
     # GET OTHER DIRECTORIES
-    main_sub = abspath(join(test_dir, "main_sub"))
-    no_dvks = abspath(join(test_dir, "no_dvks"))
+    main_sub = join(test_dir, "main_sub")
+    no_dvks = join(test_dir, "no_dvks")
     # TEST GETTING DVKS WITH THE SAME ID
     same = get_same_ids(test_dir)
     assert len(same) == 2
     assert len(same[0]) == 2
     assert basename(same[0][0]) == "multi_media.dvk"
-    assert abspath(join(same[0][0], pardir)) == test_dir
+    assert dirname(same[0][0]) == test_dir
     assert basename(same[0][1]) == "valid_media.dvk"
-    assert abspath(join(same[0][1], pardir)) == test_dir
+    assert dirname(same[0][1]) == test_dir
     assert len(same[1]) == 2
     assert basename(same[1][0]) == "mm.dvk"
-    assert abspath(join(same[1][0], pardir)) == test_dir
+    assert dirname(same[1][0]) == test_dir
     assert basename(same[1][1]) == "ms.dvk"
-    assert abspath(join(same[1][1], pardir)) == main_sub
+    assert dirname(same[1][1]) == main_sub
     # TEST GETTING DVKS WITH THE SAME ID IN DIRECTORY WITHOUT DVK FILES
     assert get_same_ids(no_dvks) == []
     # TEST GETTING SAME IDS IN INVALID DIRECTORIES
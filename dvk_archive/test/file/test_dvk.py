@@ -150,6 +150,15 @@ def test_get_set_title():
     read_dvk = Dvk(dvk.get_dvk_file())
     dvk = None
     assert read_dvk.get_title() == "Title #2"
+    # Test that non-ASCII characters are written as escapes
+    read_dvk.set_title("Caf\u00e9 \U0001f600")
+    read_dvk.write_dvk()
+    with open(read_dvk.get_dvk_file(), "rb") as in_file:
+        data = in_file.read()
+    assert data.isascii()
+    assert b"\"Caf\\u00e9 \\ud83d\\ude00\"" in data
+    read_dvk = Dvk(read_dvk.get_dvk_file())
+    assert read_dvk.get_title() == "Caf\u00e9 \U0001f600"
 
 def test_get_set_artists():
     """
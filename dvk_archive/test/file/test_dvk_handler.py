@@ -6,6 +6,7 @@ from dvk_archive.test.temp_dir import get_test_dir
 from dvk_archive.main.file.dvk import Dvk
 from dvk_archive.main.file.dvk_handler import DvkHandler
 from dvk_archive.main.file.dvk_handler import get_directories
+from dvk_archive.main.file.dvk_handler import read_directory_dvks
 
 def create_test_files() -> str:
     """
@@ -210,6 +211,20 @@ def test_get_directories():
     dirs = get_directories(join(test_dir, "notreal"))
     assert len(dirs) == 0
 
+def test_read_directory_dvks():
+    """
+    Tests the read_directory_dvks function.
+    """
+    # TEST READING DVKS WITHOUT SUBDIRECTORIES
+    test_dir = create_test_files()
+    dvks = read_directory_dvks(test_dir)
+    titles = sorted([dvk.get_title() for dvk in dvks])
+    assert titles == ["TITLE 0.55", "Title 10"]
+    # TEST READING DIRECTORY WITHOUT DVK FILES
+    assert read_directory_dvks(join(test_dir, "empty")) == []
+    # TEST READING INVALID DIRECTORY
+    assert read_directory_dvks(None) == []
+
 def test_sort_title():
     """
     Tests the sort_dvks method when sorting alphabetically by title.
@@ -432,6 +447,34 @@ def test_get_dvk_by_id():
     assert dvk_handler.get_dvk_by_id("Id123") == 2
     assert dvk_handler.get_dvk_by_id("NON369") == -1
     assert dvk_handler.get_dvk_by_id(None) == -1
+    # TEST GETTING ID INDEX AFTER CHANGING THE DVK LIST
+    dvk_handler.remove_dvk(0)
+    assert dvk_handler.get_dvk_by_id("OTH246") == -1
+    assert dvk_handler.get_dvk_by_id("THR987") == 0
+    assert dvk_handler.get_dvk_by_id("ID123") == 1
+    dvk.set_dvk_id("NEW135")
+    dvk_handler.set_dvk(dvk, 1)
+    assert dvk_handler.get_dvk_by_id("NEW135") == 1
+    assert dvk_handler.get_dvk_by_id("ID123") == -1
+    dvk_handler.get_dvk(1).set_title("Alpha")
+    dvk_handler.sort_dvks("a")
+    assert dvk_handler.get_dvk_by_id("NEW135") == 0
+    assert dvk_handler.get_dvk_by_id("THR987") == 1
+    # TEST GETTING ID INDEX AFTER CHANGING A LOADED DVK'S ID
+    dvk_handler.get_dvk(0).set_dvk_id("CHG579")
+    assert dvk_handler.get_dvk_by_id("CHG579") == 0
+    assert dvk_handler.get_dvk_by_id("NEW135") == -1
+    dvk_handler.get_dvk(1).set_dvk_id("NEW135")
+    assert dvk_handler.get_dvk_by_id("NEW135") == 1
+    assert dvk_handler.get_dvk_by_id("THR987") == -1
+    # TEST GETTING ID INDEXES
+    assert dvk_handler.get_id_indexes() == {"CHG579":0, "NEW135":1}
+    # TEST THAT THE FIRST DVK WITH A DUPLICATED ID IS RETURNED
+    dvk_handler.get_dvk(0).set_dvk_id("NEW135")
+    assert dvk_handler.get_dvk_by_id("NEW135") == 0
+    assert dvk_handler.get_dvk_by_id("CHG579") == -1
+    assert dvk_handler.get_id_indexes() == {"NEW135":0}
+    assert DvkHandler().get_id_indexes() == {}
 
 def test_contains_id():
     """
@@ -551,6 +594,7 @@ def all_tests():
     """
     test_read_dvks()
     test_get_directories()
+    test_read_directory_dvks()
     test_sort_title()
     test_sort_time()
     test_add_dvk()
@@ -87,6 +87,8 @@ def test_get_time_string():
     assert get_time_string(dvk, False) == "Posted <b>02 May 1997 - 13:45</b>"
     dvk.set_time("2085/06/26|09:23")
     assert get_time_string(dvk, False) == "Posted <b>26 Jun 2085 - 09:23</b>"
+    dvk.set_time("2019/02/30|10:00")
+    assert get_time_string(dvk, False) == "Posted <b>30 Feb 2019 - 10:00</b>"
     # Test getting time strings with 12 hour clock
     dvk.set_time("2156/07/24|00:30")
     assert get_time_string(dvk) == "Posted <b>24 Jul 2156 - 12:30 AM</b>"
@@ -116,6 +118,8 @@ def test_is_image_extension():
     assert is_image_extension(".gif")
     assert is_image_extension(".svg")
     assert is_image_extension(".webp")
+    assert is_image_extension(".PNG")
+    assert is_image_extension(".Jpeg")
     # Test extensions that are not images
     assert not is_image_extension(".txt")
     assert not is_image_extension(".html")
@@ -436,6 +440,18 @@ def test_write_dvk_html():
         contents = f.read()
     html = "<a class=\"dvk_link\" href=\"file:///previous.html\">&lt; PREV</a>"
     assert html in contents
+    # Test writing HTML with an existing CSS file
+    css_file = create_css(get_test_dir())
+    new_path = write_dvk_html(dvk, "css.html", delete=True, css=css_file)
+    assert exists(new_path)
+    with open(new_path) as f:
+        contents = f.read()
+    assert "href=\"" + css_file + "\"" in contents
+    # Test that an existing CSS file in the temp directory isn't deleted
+    css_file = create_css(get_temp_directory())
+    new_path = write_dvk_html(dvk, "temp_css.html", delete=True, css=css_file)
+    assert exists(new_path)
+    assert exists(css_file)
     # Test writing invalid dvks
     assert write_dvk_html(dvk, None) == ""
     dvk.set_title(None)
@@ -55,6 +55,7 @@ def test_get_data_dvk():
     lines = "I|sep\n\n"\
                 +"A| Other A, ,Person,  Guy ,\n"\
                 +"pointless text\n"\
+                +"Hi|not an id\n"\
                 +"P|2022-03-12-11-26\n\r"\
                 +"T| Tag , , Other, web tag , \r"\
                 +"d| Test<br/>Thing \r\n"\
@@ -255,6 +255,10 @@ def test_get_sequence():
     assert get_sequence(dvk_handler, 3) == [3,4,5]
     assert get_sequence(dvk_handler, 4) == [3,4,5]
     assert get_sequence(dvk_handler, 5) == [3,4,5]
+    id_indexes = dvk_handler.get_id_indexes()
+    assert get_sequence(dvk_handler, 3, id_indexes) == [3,4,5]
+    assert get_sequence(dvk_handler, 5, id_indexes) == [3,4,5]
+    assert get_sequence(dvk_handler, 2, id_indexes) == [2]
     # Test getting sequence that forms a loop
     couple = dvk_handler.get_dvk(0)
     assert couple.get_dvk_id() == "CPL01"
@@ -3,6 +3,7 @@
 from dvk_archive.main.processing.string_compare import compare_alphanum
 from dvk_archive.main.processing.string_compare import compare_sections
 from dvk_archive.main.processing.string_compare import compare_strings
+from dvk_archive.main.processing.string_compare import get_alphanum_key
 from dvk_archive.main.processing.string_compare import is_number_string
 from dvk_archive.main.processing.string_compare import get_section
 
@@ -128,6 +129,29 @@ def test_compare_alphanum():
     assert compare_alphanum("b", None) == 0
     assert compare_alphanum(None, None) == 0
 
+def test_get_alphanum_key():
+    """
+    Tests the get_alphanum_key function.
+    """
+    assert get_alphanum_key("B") > get_alphanum_key("a")
+    assert get_alphanum_key("Test1") < get_alphanum_key("Test2")
+    assert get_alphanum_key("string 100") > get_alphanum_key("String 2")
+    assert get_alphanum_key("Same25") == get_alphanum_key("same25")
+    assert get_alphanum_key("Test 0.5") > get_alphanum_key("Test 0,05")
+    assert get_alphanum_key("v1.2.10") > get_alphanum_key("v1.2.02")
+    assert get_alphanum_key("Thing 5 Extra") < get_alphanum_key("Thing 20")
+    assert get_alphanum_key("") < get_alphanum_key("thing")
+    section1 = "12345678900000000000000000000000000000000000000000000"
+    section2 = "12345678900000000000000000000000000000000000000000001"
+    assert get_alphanum_key(section1) < get_alphanum_key(section2)
+    # Test sorting a list with keys
+    lst = ["Title 10", "title 0.55", "Title 2", "Other"]
+    lst = sorted(lst, key=get_alphanum_key)
+    assert lst == ["Other", "title 0.55", "Title 2", "Title 10"]
+    # Test getting key for invalid string
+    assert get_alphanum_key() == ()
+    assert get_alphanum_key(None) == ()
+
 def all_tests():
     """
     Runs all tests for the string_compare module.
@@ -137,3 +161,4 @@ def all_tests():
     test_is_number_string()
     test_compare_sections()
     test_compare_alphanum()
+    test_get_alphanum_key()
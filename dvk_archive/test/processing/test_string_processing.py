@@ -4,6 +4,7 @@ from dvk_archive.main.processing.string_processing import pad_num
 from dvk_archive.main.processing.string_processing import get_filename
 from dvk_archive.main.processing.string_processing import truncate_string
 from dvk_archive.main.processing.string_processing import get_url_directory
+from dvk_archive.main.processing.string_processing import get_extension
 from dvk_archive.main.processing.string_processing import truncate_path
 
 def test_pad_num():
@@ -41,6 +42,10 @@ def test_get_filename():
     assert get_filename("ìíîï") == "iiii"
     assert get_filename("ñòóôõö") == "nooooo"
     assert get_filename("ùúûüýÿ") == "uuuuyy"
+    # Test getting filenames that are already clean
+    assert get_filename("Clean Title 2") == "Clean Title 2"
+    assert get_filename("Clean Title 2", 5) == "Cle 2"
+    assert get_filename("Clean Title 2", -1) == "Clean Title 2"
     # Test getting filenames with no length
     assert get_filename("") == "0"
     assert get_filename("$") == "0"
@@ -95,6 +100,23 @@ def test_get_url_directory():
     assert get_url_directory("") == ""
     assert get_url_directory(None) == ""
 
+def test_get_extension():
+    """
+    Tests the get_extension function.
+    """
+    # Test getting extensions from filenames
+    assert get_extension("test.png") == ".png"
+    assert get_extension("file.Jpeg") == ".Jpeg"
+    assert get_extension("other.thing.txt") == ".txt"
+    # Test getting extensions from URLs with query strings
+    assert get_extension("test.png?extra.thing") == ".png"
+    assert get_extension("a/b.gif?c.jpg?d") == ".jpg"
+    # Test getting invalid extensions
+    assert get_extension("test.tolong") == ""
+    assert get_extension("noextension") == ""
+    assert get_extension("") == ""
+    assert get_extension(None) == ""
+
 def test_truncate_path():
     """
     Tests the truncate_path function.
@@ -122,4 +144,5 @@ def all_tests():
     test_get_filename()
     test_truncate_string()
     test_get_url_directory()
+    test_get_extension()
     test_truncate_path()
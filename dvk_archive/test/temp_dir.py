@@ -12,7 +12,7 @@ def get_test_dir() -> str:
     :return: File path of the test directory
     :rtype: str
     """
-    test_dir = abspath(join(abspath(gettempdir()), "dvk_test"))
+    test_dir = join(abspath(gettempdir()), "dvk_test")
     if(exists(test_dir)):
         rmtree(test_dir)
     mkdir(test_dir)
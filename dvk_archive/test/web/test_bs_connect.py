@@ -7,6 +7,7 @@ from dvk_archive.main.web.bs_connect import bs_connect
 from dvk_archive.main.web.bs_connect import basic_connect
 from dvk_archive.main.web.bs_connect import convert_data_uri
 from dvk_archive.main.web.bs_connect import download
+from dvk_archive.main.web.bs_connect import download_many
 from dvk_archive.main.web.bs_connect import get_default_headers
 from dvk_archive.main.web.bs_connect import get_direct_response
 from dvk_archive.main.web.bs_connect import get_last_modified
@@ -151,6 +152,29 @@ def test_download():
     download(url, None)
     assert not exists(file)
 
+def test_download_many():
+    """
+    Tests the download_many function.
+    """
+    # Test downloading multiple data URIs
+    test_dir = get_test_dir()
+    url = "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAUAAAAFCAYAAACNbybl"\
+                +"AAAAHElEQVQI12P4//8/w38GIAXDIBKE0DHxgljNBAAO9TXL0Y4OHwAAAAB"\
+                +"JRU5ErkJggg=="
+    files = [abspath(join(test_dir, "dot1")), abspath(join(test_dir, "dot2"))]
+    headers = download_many([url, url], files)
+    assert headers == [dict(), dict()]
+    assert stat(files[0]).st_size == 85
+    assert stat(files[1]).st_size == 85
+    # Test downloading with invalid parameters
+    file = join(test_dir, "invalid.jpg")
+    assert download_many([None, "asdfasdf"], [file, file]) == [dict(), dict()]
+    assert not exists(file)
+    assert download_many([url], [file, file]) == []
+    assert not exists(file)
+    assert download_many([], []) == []
+    assert download_many(None, None) == []
+
 def test_get_last_modified():
     """
     Tests the get_last_modified function.
@@ -200,4 +224,5 @@ def all_tests():
     test_bs_connect()
     test_json_connect()
     test_download()
+    test_download_many()
     test_get_last_modified()
@@ -39,6 +39,7 @@ setuptools.setup(
         "html5lib",
         "HTML-String-Tools",
         "lxml",
+        "orjson",
         "requests",
         "selenium",
         "tqdm"],
@@ -47,6 +48,6 @@ setuptools.setup(
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
         "Operating System :: OS Independent"
     ],
-    python_requires='>=3.0',
+    python_requires='>=3.8',
     entry_points={"console_scripts": console_scripts}
 )